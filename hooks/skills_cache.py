@@ -0,0 +1,390 @@
+"""
+Shared skills/commands manifest cache for hooks.
+
+Every session fires hooks that scan the same skill and command directories.
+On machines running many sessions at once, this module lets those hook
+processes share one scan:
+
+1. Readers mmap the cache file and use it without taking any lock
+2. Writers build a new file and atomically rename it into place, so readers
+   always see either the old or the new manifest, never a partial one
+3. Each rebuild bumps a generation counter stored in the file
+4. Rebuilds are coordinated with an exclusive flock, so when many sessions
+   find a stale cache at once only one of them rescans; the rest wait briefly
+   and read its result
+
+The cache is keyed by plugin root and project directory, and is invalidated
+by a fingerprint of directory and SKILL.md/command file stats. Each rebuild
+also deletes cache files for other projects that have not been rewritten in
+CACHE_MAX_AGE_SECONDS, so one file per cwd doesn't pile up forever. The
+whole directory is safe to delete by hand at any time.
+
+Set AA_SKILLS_CACHE=0 to bypass the cache, or AA_SKILLS_CACHE_DIR to
+change where it is stored.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict
+
+try:
+    import fcntl
+except ImportError:  # Windows: no rebuild coordination, every stale reader rebuilds
+    fcntl = None
+
+
+CACHE_VERSION = 1
+
+# How long a reader waits for another process's rebuild before scanning itself
+REBUILD_WAIT_SECONDS = 2.0
+REBUILD_POLL_SECONDS = 0.01
+
+# Cache files not rewritten for this long are pruned during rebuilds
+CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+
+def find_plugin_root() -> Path:
+    """Find the plugin root directory."""
+    # Try environment variable first
+    if os.environ.get("CLAUDE_PLUGIN_ROOT"):
+        return Path(os.environ["CLAUDE_PLUGIN_ROOT"])
+
+    # Fall back to script location
+    script_dir = Path(__file__).parent
+    return script_dir.parent
+
+
+def get_all_skill_directories(plugin_root: Path, project_dir: Optional[str]) -> List[Tuple[Path, str]]:
+    """Get all directories that may contain skills.
+
+    Returns list of (path, source_label) tuples.
+    """
+    dirs = []
+
+    # 1. Global user skills: ~/.claude/skills
+    global_skills = Path.home() / ".claude" / "skills"
+    if global_skills.exists():
+        dirs.append((global_skills, "global"))
+
+    # 2. Project-specific skills: ${PROJECT_PATH}/.claude/skills
+    if project_dir:
+        project_skills = Path(project_dir) / ".claude" / "skills"
+        if project_skills.exists():
+            dirs.append((project_skills, "project"))
+
+    # 3. Plugin's own skills
+    plugin_skills = plugin_root / "skills"
+    if plugin_skills.exists():
+        dirs.append((plugin_skills, "plugin"))
+
+    return dirs
+
+
+def get_all_command_directories(plugin_root: Path, project_dir: Optional[str]) -> List[Tuple[Path, str]]:
+    """Get all directories that may contain commands.
+
+    Returns list of (path, source_label) tuples.
+    """
+    dirs = []
+
+    # 1. Global user commands: ~/.claude/commands
+    global_cmds = Path.home() / ".claude" / "commands"
+    if global_cmds.exists():
+        dirs.append((global_cmds, "global"))
+
+    # 2. Project-specific commands: ${PROJECT_PATH}/.claude/commands
+    if project_dir:
+        project_cmds = Path(project_dir) / ".claude" / "commands"
+        if project_cmds.exists():
+            dirs.append((project_cmds, "project"))
+
+    # 3. Plugin's own commands
+    plugin_cmds = plugin_root / "commands"
+    if plugin_cmds.exists():
+        dirs.append((plugin_cmds, "plugin"))
+
+    return dirs
+
+
+def parse_skill_frontmatter(content: str) -> dict:
+    """Extract name and description from SKILL.md frontmatter."""
+    frontmatter_match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
+    if not frontmatter_match:
+        return {}
+
+    frontmatter = frontmatter_match.group(1)
+    result = {}
+
+    for line in frontmatter.split('\n'):
+        if ':' in line:
+            key, value = line.split(':', 1)
+            result[key.strip()] = value.strip()
+
+    return result
+
+
+def load_all_skills(plugin_root: Path, project_dir: Optional[str]) -> List[Dict]:
+    """Load all skills from all skill directories."""
+    skills = []
+    seen_names = set()
+
+    for skills_dir, source in get_all_skill_directories(plugin_root, project_dir):
+        for skill_dir in skills_dir.iterdir():
+            if not skill_dir.is_dir():
+                continue
+
+            skill_file = skill_dir / "SKILL.md"
+            if not skill_file.exists():
+                continue
+
+            try:
+                content = skill_file.read_text()
+                frontmatter = parse_skill_frontmatter(content)
+
+                description = frontmatter.get("description", "")
+                name = frontmatter.get("name", skill_dir.name)
+
+                # Skip duplicates (first one wins - global > project > plugin)
+                if name in seen_names:
+                    continue
+                seen_names.add(name)
+
+                skills.append({
+                    "name": name,
+                    "description": description,
+                    "source": source,
+                    "path": str(skill_file)
+                })
+            except Exception:
+                continue
+
+    return skills
+
+
+def load_all_commands(plugin_root: Path, project_dir: Optional[str]) -> List[Dict]:
+    """Load all slash commands from all command directories."""
+    commands = []
+    seen_names = set()
+
+    for commands_dir, source in get_all_command_directories(plugin_root, project_dir):
+        for cmd_file in commands_dir.glob("*.md"):
+            try:
+                content = cmd_file.read_text()
+                frontmatter = parse_skill_frontmatter(content)
+
+                name = frontmatter.get("name", cmd_file.stem)
+                description = frontmatter.get("description", "")
+
+                # Skip duplicates
+                if name in seen_names:
+                    continue
+                seen_names.add(name)
+
+                commands.append({
+                    "name": name,
+                    "description": description,
+                    "source": source
+                })
+            except Exception:
+                continue
+
+    return commands
+
+
+def compute_fingerprint(plugin_root: Path, project_dir: Optional[str]) -> str:
+    """Hash the stats of everything a scan would read, without reading it.
+
+    Directory mtimes catch added/removed skills and commands; file
+    mtime/size catch in-place edits (e.g. from heal-skills).
+    """
+    digest = hashlib.sha1()
+
+    def add_stat(path: Path) -> None:
+        try:
+            st = path.stat()
+            digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        except OSError:
+            digest.update(f"{path}\0missing\n".encode())
+
+    for skills_dir, source in get_all_skill_directories(plugin_root, project_dir):
+        digest.update(f"skills:{source}\n".encode())
+        add_stat(skills_dir)
+        try:
+            for skill_dir in sorted(skills_dir.iterdir()):
+                if skill_dir.is_dir():
+                    add_stat(skill_dir / "SKILL.md")
+        except OSError:
+            continue
+
+    for commands_dir, source in get_all_command_directories(plugin_root, project_dir):
+        digest.update(f"commands:{source}\n".encode())
+        add_stat(commands_dir)
+        for cmd_file in sorted(commands_dir.glob("*.md")):
+            add_stat(cmd_file)
+
+    return digest.hexdigest()
+
+
+def get_cache_dir() -> Path:
+    """Directory holding cache files shared by all sessions on this machine."""
+    if os.environ.get("AA_SKILLS_CACHE_DIR"):
+        return Path(os.environ["AA_SKILLS_CACHE_DIR"])
+    return Path.home() / ".claude" / "cache" / "aa-skills"
+
+
+def get_cache_path(plugin_root: Path, project_dir: Optional[str]) -> Path:
+    """Cache file for this plugin root and project directory."""
+    key = hashlib.sha1(f"{plugin_root.resolve()}\0{project_dir or ''}".encode()).hexdigest()[:16]
+    return get_cache_dir() / f"manifest-{key}.json"
+
+
+def read_cache(cache_path: Path) -> Optional[Dict]:
+    """Read the cache file via mmap, without locking.
+
+    Returns None if the file is missing, empty, or unreadable. A concurrent
+    rename only swaps the directory entry; the mapping stays on the inode
+    that was opened, so the data read is always one complete generation.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = json.loads(mm[:])
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return None
+    return data
+
+
+def write_cache(cache_path: Path, data: Dict) -> None:
+    """Write the cache file atomically (temp file + rename)."""
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def prune_cache(cache_dir: Path, keep: Path) -> None:
+    """Delete cache files for other keys that haven't been rewritten lately.
+
+    A manifest's lock is only removed if no one holds it. A pruned project
+    that is still in use just rebuilds once on its next hook.
+    """
+    cutoff = time.time() - CACHE_MAX_AGE_SECONDS
+
+    candidates = list(cache_dir.glob("manifest-*.json")) + list(cache_dir.glob("manifest-*.tmp"))
+    # Locks whose manifest is already gone (e.g. deleted by hand)
+    candidates += [p for p in cache_dir.glob("manifest-*.lock") if not p.with_suffix(".json").exists()]
+
+    for path in candidates:
+        if path == keep or path == keep.with_suffix(".lock"):
+            continue
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+        except OSError:
+            continue
+
+        if path.suffix == ".tmp":
+            # Left behind by a writer that crashed mid-write
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            continue
+
+        lock_path = path.with_suffix(".lock")
+        try:
+            with open(lock_path, "a") as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                if path != lock_path:
+                    path.unlink()
+                lock_path.unlink()
+        except OSError:
+            continue
+
+
+def build_manifest(plugin_root: Path, project_dir: Optional[str], fingerprint: str, generation: int) -> Dict:
+    """Scan all skill and command directories into a cache record."""
+    return {
+        "version": CACHE_VERSION,
+        "generation": generation,
+        "fingerprint": fingerprint,
+        "skills": load_all_skills(plugin_root, project_dir),
+        "commands": load_all_commands(plugin_root, project_dir),
+    }
+
+
+def rebuild(cache_path: Path, plugin_root: Path, project_dir: Optional[str], fingerprint: str) -> Dict:
+    """Rebuild the cache, letting only one process at a time do the scan.
+
+    Whoever takes the lock rescans and publishes. Everyone else polls for the
+    lock; once they get it they re-check the cache first, so a herd of stale
+    readers results in a single rescan.
+    """
+    lock_file = None
+    if fcntl is not None:
+        lock_file = open(cache_path.with_suffix(".lock"), "a")
+        deadline = time.monotonic() + REBUILD_WAIT_SECONDS
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    # Writer is stuck or slow: scan for ourselves, don't publish
+                    lock_file.close()
+                    return build_manifest(plugin_root, project_dir, fingerprint, 0)
+                time.sleep(REBUILD_POLL_SECONDS)
+
+    try:
+        current = read_cache(cache_path)
+        if current and current.get("fingerprint") == fingerprint:
+            return current
+
+        generation = (current or {}).get("generation", 0) + 1
+        data = build_manifest(plugin_root, project_dir, fingerprint, generation)
+        write_cache(cache_path, data)
+        prune_cache(cache_path.parent, cache_path)
+        return data
+    finally:
+        if lock_file is not None:
+            lock_file.close()
+
+
+def get_manifest(plugin_root: Path, project_dir: Optional[str]) -> Dict:
+    """Get the skills/commands manifest, from cache when it is still fresh.
+
+    Returns a dict with "skills" and "commands" lists. Falls back to a direct
+    scan if the cache is disabled or its directory can't be written.
+    """
+    fingerprint = compute_fingerprint(plugin_root, project_dir)
+
+    if os.environ.get("AA_SKILLS_CACHE") == "0":
+        return build_manifest(plugin_root, project_dir, fingerprint, 0)
+
+    cache_path = get_cache_path(plugin_root, project_dir)
+    cached = read_cache(cache_path)
+    if cached and cached.get("fingerprint") == fingerprint:
+        return cached
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        return rebuild(cache_path, plugin_root, project_dir, fingerprint)
+    except OSError:
+        return build_manifest(plugin_root, project_dir, fingerprint, 0)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Fixture check for beads-schedule.py.
+
+Runs the scheduler against a stub bd for each case in fixtures/beads/ and
+compares batches, critical path, conflicts, blocked issues and cycles with
+the case's expected.json.
+
+Each case directory holds:
+1. list.json, ready.json, blocked.json: what the stub serves for
+   `bd list`, `bd ready` and `bd blocked`
+2. expected.json: scheduler arguments ("args") and expected output fields
+3. Any plan files the arguments refer to (paths relative to the case)
+
+Usage:
+    beads-schedule-check.py [case ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SCHEDULER = SCRIPTS_DIR / "beads-schedule.py"
+FIXTURES_DIR = SCRIPTS_DIR / "fixtures" / "beads"
+STUB_BD = FIXTURES_DIR / "bd"
+
+CHECKED_FIELDS = ("batches", "critical_path", "conflicts", "blocked", "cycles")
+
+
+def run_case(case_dir: Path) -> list[str]:
+    """Run the scheduler for one case. Returns a list of failure messages."""
+    expected = json.loads((case_dir / "expected.json").read_text())
+
+    result = subprocess.run(
+        [sys.executable, str(SCHEDULER), "--bd", str(STUB_BD)] + expected.get("args", []),
+        capture_output=True,
+        text=True,
+        cwd=case_dir,
+        env=dict(os.environ, BD_FIXTURE_DIR=str(case_dir)),
+    )
+    if result.returncode != 0:
+        return [f"exit {result.returncode}: {result.stderr.strip()}"]
+
+    try:
+        output = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return ["scheduler printed invalid JSON"]
+
+    failures = []
+    for field in CHECKED_FIELDS:
+        if field in expected and output.get(field) != expected[field]:
+            failures.append(f"{field}: expected {json.dumps(expected[field])}, got {json.dumps(output.get(field))}")
+    return failures
+
+
+def main():
+    names = sys.argv[1:]
+    case_dirs = [FIXTURES_DIR / name for name in names] if names else sorted(
+        path for path in FIXTURES_DIR.iterdir() if (path / "expected.json").exists()
+    )
+
+    failed = 0
+    for case_dir in case_dirs:
+        if not (case_dir / "expected.json").exists():
+            sys.exit(f"error: no expected.json in {case_dir}")
+
+        failures = run_case(case_dir)
+        print(f"{'FAIL' if failures else 'ok  '}  {case_dir.name}")
+        for failure in failures:
+            print(f"      {failure}")
+        failed += bool(failures)
+
+    print(f"\n{len(case_dirs) - failed} passed, {failed} failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Dependency-graph scheduler for /run-beads parallel execution.
+
+Reads the same data /run-beads already pulls from beads:
+1. `bd list --status open --json` for the candidate issues
+2. `bd ready --json` for issues with no open blockers
+3. `bd blocked --json` for blocker edges
+
+plus `bd list --status deferred --json`, so children of deferred epics are
+left out of the schedule.
+
+It then computes topological execution waves, the critical path, and a
+concurrency-limited batch schedule. Issues that touch the same files (as
+named in the plan section or the issue text) are never put in the same batch.
+
+Usage:
+    beads-schedule.py [--epic ID | --plan PATH | --issues ID,...] [--max-parallel N] [--bd BIN]
+
+Prints a JSON schedule to stdout. Re-run after each batch closes: closed
+issues drop out of the open list and the schedule is recomputed.
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional, List, Dict, Set, Tuple
+
+
+# Dependency types that order execution. parent-child only ties a task to its
+# epic, and related/discovered-from are informational.
+BLOCKING_DEP_TYPES = {"blocks", ""}
+
+# Path-like tokens: backticked paths, or bare tokens with a directory and an extension
+BACKTICK_PATH = re.compile(r'`([\w./-]*[\w-]\.[A-Za-z][\w]{0,7}|[\w.-]+(?:/[\w.-]+)+/?)`')
+BARE_PATH = re.compile(r'(?<![\w/.:-])((?:[\w.-]+/)+[\w-][\w.-]*\.[A-Za-z][\w]{0,7})(?![\w/-])')
+
+# Fenced code blocks (``` or ~~~), skipped when reading plans
+FENCED_BLOCK = re.compile(r'^ {0,3}(`{3,}|~{3,}).*?(?:^ {0,3}\1[ \t]*$|\Z)', re.MULTILINE | re.DOTALL)
+
+# A backticked name without a directory (`foo.bar`) is usually code, not a
+# file. Only treat it as a file with one of these extensions or if it exists.
+FILE_EXTENSIONS = {
+    "py", "pyi", "js", "jsx", "mjs", "cjs", "ts", "tsx", "go", "rs", "rb", "java",
+    "kt", "swift", "c", "h", "cc", "cpp", "hpp", "cs", "php", "sh", "sql",
+    "html", "css", "scss", "vue", "svelte", "md", "txt", "json", "yaml", "yml",
+    "toml", "ini", "cfg", "conf", "env", "lock", "xml", "proto", "graphql",
+}
+
+
+def run_bd(bd: str, args: List[str]) -> list:
+    """Run a bd subcommand with --json and return the parsed list."""
+    try:
+        result = subprocess.run(
+            [bd] + args + ["--json"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError:
+        sys.exit(f"error: '{bd}' not found on PATH")
+    except subprocess.CalledProcessError as e:
+        sys.exit(f"error: {bd} {' '.join(args)} failed: {e.stderr.strip()}")
+
+    output = result.stdout.strip()
+    if not output:
+        return []
+    try:
+        data = json.loads(output)
+    except json.JSONDecodeError:
+        sys.exit(f"error: {bd} {' '.join(args)} returned invalid JSON")
+
+    # Some bd versions wrap results, e.g. {"issues": [...]}
+    if isinstance(data, dict):
+        for key in ("issues", "items", "results"):
+            if isinstance(data.get(key), list):
+                return data[key]
+        return []
+    return data if isinstance(data, list) else []
+
+
+def get_parent(issue: Dict) -> Optional[str]:
+    """Get the parent (epic) ID of an issue, if any."""
+    if issue.get("parent"):
+        return str(issue["parent"])
+
+    for dep in issue.get("dependencies") or []:
+        if isinstance(dep, dict) and dep.get("type") == "parent-child":
+            return dep.get("depends_on_id") or dep.get("id")
+
+    # Hierarchical IDs: bd-a3f8.1 is a child of bd-a3f8
+    issue_id = str(issue.get("id", ""))
+    if "." in issue_id:
+        return issue_id.rsplit(".", 1)[0]
+
+    return None
+
+
+def get_blockers(issue: Dict) -> Set[str]:
+    """Get IDs of issues that block this one, from any dependency shape bd emits."""
+    blockers = set()
+
+    for dep in issue.get("dependencies") or []:
+        if isinstance(dep, str):
+            blockers.add(dep)
+        elif isinstance(dep, dict):
+            if dep.get("type", "") not in BLOCKING_DEP_TYPES:
+                continue
+            target = dep.get("depends_on_id") or dep.get("id")
+            if target and target != issue.get("id"):
+                blockers.add(str(target))
+
+    for blocker in issue.get("blocked_by") or []:
+        blockers.add(str(blocker))
+
+    return blockers
+
+
+def parent_of(issue_id: str, issues: Dict[str, Dict]) -> Optional[str]:
+    """Get the parent ID of an issue, even if bd didn't return the issue itself."""
+    if issue_id in issues:
+        return get_parent(issues[issue_id])
+    return get_parent({"id": issue_id})
+
+
+def is_in_scope(issue_id: str, issues: Dict[str, Dict], epic: Optional[str]) -> bool:
+    """Check whether an issue falls under the epic (any depth)."""
+    if epic is None:
+        return True
+
+    seen = set()
+    current = issue_id
+    while current and current not in seen:
+        seen.add(current)
+        parent = parent_of(current, issues)
+        if parent == epic:
+            return True
+        current = parent
+    return False
+
+
+def is_deferred(issue_id: str, issues: Dict[str, Dict]) -> bool:
+    """Check whether an issue or any of its ancestors is deferred."""
+    seen = set()
+    current = issue_id
+    while current and current not in seen:
+        seen.add(current)
+        if issues.get(current, {}).get("status") == "deferred":
+            return True
+        current = parent_of(current, issues)
+    return False
+
+
+def strip_code_blocks(text: str) -> str:
+    """Remove fenced code blocks so their headings and names are ignored."""
+    return FENCED_BLOCK.sub("", text)
+
+
+def is_file_name(name: str) -> bool:
+    """Check whether a backticked name without a directory is a file."""
+    extension = name.rsplit(".", 1)[-1].lower()
+    return extension in FILE_EXTENSIONS or Path(name).is_file()
+
+
+def extract_paths(text: str) -> Set[str]:
+    """Extract file paths mentioned in free text.
+
+    Names without a directory are checked against known extensions and the
+    working directory (the repo /run-beads runs in).
+    """
+    paths = set()
+    for pattern in (BACKTICK_PATH, BARE_PATH):
+        for match in pattern.finditer(text):
+            path = re.sub(r'^(?:\./)+', '', match.group(1)).rstrip("/")
+            if not path or "://" in path:
+                continue
+            if "/" not in path and not is_file_name(path):
+                continue
+            paths.add(path)
+    return paths
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a task title for matching plan headings to issue titles."""
+    title = re.sub(r'^\s*(?:task\s*)?\d+[.:)]\s*', '', title, flags=re.IGNORECASE)
+    return re.sub(r'[^a-z0-9]+', ' ', title.lower()).strip()
+
+
+def parse_plan(plan_path: Path) -> Tuple[Optional[str], Dict[str, Set[str]]]:
+    """Parse a plan file for the epic ID and the files each task touches.
+
+    Returns (epic_id, {issue_id: paths}). Issue IDs come from the
+    `## Beads Issues` table; paths come from the plan section whose heading
+    matches the task title.
+    """
+    try:
+        content = strip_code_blocks(plan_path.read_text())
+    except (OSError, UnicodeDecodeError) as e:
+        sys.exit(f"error: cannot read plan: {e}")
+
+    epic_id = None
+    title_to_id = {}
+
+    beads_match = re.search(r'^##\s+Beads Issues\s*$(.*?)(?=^##\s|\Z)', content, re.MULTILINE | re.DOTALL)
+    if beads_match:
+        section = beads_match.group(1)
+        epic_match = re.search(r'Epic:\s*`([^`]+)`', section)
+        if epic_match:
+            epic_id = epic_match.group(1)
+        for row in re.finditer(r'^\|\s*`([^`]+)`\s*\|\s*([^|]+?)\s*\|', section, re.MULTILINE):
+            title_to_id[normalize_title(row.group(2))] = row.group(1)
+
+    files = {}
+    headings = list(re.finditer(r'^(#{1,6})\s+(.+?)\s*$', content, re.MULTILINE))
+    for i, heading in enumerate(headings):
+        issue_id = title_to_id.get(normalize_title(heading.group(2)))
+        if not issue_id:
+            continue
+
+        # Section runs until the next heading of the same or higher level
+        level = len(heading.group(1))
+        end = len(content)
+        for next_heading in headings[i + 1:]:
+            if len(next_heading.group(1)) <= level:
+                end = next_heading.start()
+                break
+
+        files.setdefault(issue_id, set()).update(extract_paths(content[heading.end():end]))
+
+    return epic_id, files
+
+
+def issue_files(issue: Dict) -> Set[str]:
+    """Extract file paths mentioned in an issue's text fields."""
+    text = "\n".join(
+        str(issue.get(field) or "")
+        for field in ("title", "description", "design", "acceptance_criteria", "notes")
+    )
+    return extract_paths(text)
+
+
+def build_graph(
+    open_issues: list,
+    ready_issues: list,
+    blocked_issues: list,
+    deferred_issues: list,
+    epic: Optional[str],
+    only: Optional[Set[str]] = None,
+) -> Tuple[Dict[str, Dict], Dict[str, Set[str]], Dict[str, List[str]]]:
+    """Build the in-scope dependency graph.
+
+    Scope is the epic's tasks, the issue IDs in only, or every open issue.
+    Deferred issues are never scheduled, but are needed to skip their children.
+    Returns (nodes, deps, external) where deps maps each schedulable issue to
+    its in-scope blockers and external maps issues held back by blockers
+    outside the schedule (other epics, in-progress work).
+    """
+    issues = {}
+    for issue in open_issues + ready_issues + blocked_issues + deferred_issues:
+        if not isinstance(issue, dict) or not issue.get("id"):
+            continue
+        issue_id = str(issue["id"])
+        merged = issues.setdefault(issue_id, {})
+        for key, value in issue.items():
+            if key == "blocked_by":
+                merged.setdefault("blocked_by", [])
+                merged["blocked_by"] = sorted(set(merged["blocked_by"]) | set(value or []))
+            elif value not in (None, "", []) or key not in merged:
+                merged[key] = value
+
+    # bd blocked reports blockers it knows are still open, even ones our
+    # open list doesn't include (e.g. in_progress); those always hold back.
+    known_blockers = {
+        str(issue["id"]): {str(b) for b in issue.get("blocked_by") or []}
+        for issue in blocked_issues
+        if isinstance(issue, dict) and issue.get("id")
+    }
+    open_ids = {str(issue["id"]) for issue in open_issues if isinstance(issue, dict) and issue.get("id")}
+
+    nodes = {
+        issue_id: issue
+        for issue_id, issue in issues.items()
+        if issue.get("status", "open") == "open"
+        and issue.get("issue_type") != "epic"
+        and issue_id != epic
+        and is_in_scope(issue_id, issues, epic)
+        and (only is None or issue_id in only)
+        and not is_deferred(issue_id, issues)
+    }
+
+    deps = {}
+    external = {}
+    for issue_id, issue in nodes.items():
+        parent = get_parent(issue)
+        inside = set()
+        outside = set()
+        for blocker in get_blockers(issue):
+            if blocker == parent:
+                continue
+            if blocker in nodes:
+                inside.add(blocker)
+            elif blocker in open_ids or blocker in known_blockers.get(issue_id, set()):
+                outside.add(blocker)
+            # Anything else is no longer open and is satisfied
+
+        if outside:
+            external[issue_id] = sorted(outside)
+        else:
+            deps[issue_id] = inside
+
+    # Drop issues that transitively wait on an externally blocked one
+    changed = True
+    while changed:
+        changed = False
+        for issue_id in list(deps):
+            held = sorted(b for b in deps[issue_id] if b in external)
+            if held:
+                external[issue_id] = held
+                del deps[issue_id]
+                changed = True
+
+    return nodes, deps, external
+
+
+def topological_waves(deps: Dict[str, Set[str]]) -> Tuple[List[List[str]], List[str]]:
+    """Group issues into waves where each wave only depends on earlier ones.
+
+    Returns (waves, cyclic) where cyclic lists issues that can never start
+    because they are on or behind a dependency cycle.
+    """
+    remaining = {issue_id: set(blockers) for issue_id, blockers in deps.items()}
+    waves = []
+
+    while remaining:
+        wave = sorted(issue_id for issue_id, blockers in remaining.items() if not blockers)
+        if not wave:
+            break
+        waves.append(wave)
+        for issue_id in wave:
+            del remaining[issue_id]
+        for blockers in remaining.values():
+            blockers.difference_update(wave)
+
+    return waves, sorted(remaining)
+
+
+def tail_lengths(deps: Dict[str, Set[str]], waves: List[List[str]]) -> Dict[str, int]:
+    """Length (in issues) of the longest chain starting at each issue."""
+    dependents = {issue_id: set() for issue_id in deps}
+    for issue_id, blockers in deps.items():
+        for blocker in blockers:
+            if blocker in dependents:
+                dependents[blocker].add(issue_id)
+
+    tails = {}
+    for wave in reversed(waves):
+        for issue_id in wave:
+            tails[issue_id] = 1 + max((tails[d] for d in dependents[issue_id]), default=0)
+    return tails
+
+
+def critical_path(deps: Dict[str, Set[str]], tails: Dict[str, int]) -> List[str]:
+    """Follow the longest chain from its root to its end."""
+    if not tails:
+        return []
+
+    dependents = {issue_id: [] for issue_id in tails}
+    for issue_id, blockers in deps.items():
+        if issue_id not in tails:
+            continue
+        for blocker in blockers:
+            if blocker in dependents:
+                dependents[blocker].append(issue_id)
+
+    roots = [issue_id for issue_id in tails if not deps[issue_id]]
+    current = min(roots, key=lambda i: (-tails[i], i))
+    path = [current]
+    while dependents[current]:
+        current = min(dependents[current], key=lambda i: (-tails[i], i))
+        path.append(current)
+    return path
+
+
+def find_conflicts(files: Dict[str, Set[str]]) -> List[Dict]:
+    """Find pairs of issues that touch the same files."""
+    conflicts = []
+    ids = sorted(files)
+    for i, issue_id in enumerate(ids):
+        for other in ids[i + 1:]:
+            shared = files[issue_id] & files[other]
+            if shared:
+                conflicts.append({"issues": [issue_id, other], "files": sorted(shared)})
+    return conflicts
+
+
+def schedule_batches(
+    deps: Dict[str, Set[str]],
+    tails: Dict[str, int],
+    nodes: Dict[str, Dict],
+    files: Dict[str, Set[str]],
+    max_parallel: int,
+) -> List[List[str]]:
+    """List-schedule issues into batches of at most max_parallel.
+
+    Each batch starts once the previous one has closed. Ready issues are
+    picked longest-chain first, then by priority; an issue sharing files with
+    one already in the batch waits for a later batch.
+    """
+    def priority(issue_id: str) -> int:
+        value = nodes[issue_id].get("priority")
+        return value if isinstance(value, int) else 2
+
+    done = set()
+    batches = []
+
+    while len(done) < len(tails):
+        ready = [
+            issue_id for issue_id in tails
+            if issue_id not in done and deps[issue_id] <= done
+        ]
+        ready.sort(key=lambda i: (-tails[i], priority(i), i))
+
+        batch = []
+        batch_files = set()
+        for issue_id in ready:
+            if len(batch) >= max_parallel:
+                break
+            if files.get(issue_id, set()) & batch_files:
+                continue
+            batch.append(issue_id)
+            batch_files.update(files.get(issue_id, set()))
+
+        batches.append(batch)
+        done.update(batch)
+
+    return batches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute a parallel execution schedule for beads issues")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--epic", help="Only schedule tasks under this epic")
+    scope.add_argument("--plan", help="Plan file with a '## Beads Issues' section")
+    scope.add_argument("--issues", help="Only schedule these comma-separated issue IDs")
+    parser.add_argument("--max-parallel", type=int, default=3, help="Maximum concurrent subagents (default: 3)")
+    parser.add_argument("--bd", default="bd", help="bd executable (default: bd on PATH)")
+    args = parser.parse_args()
+
+    if args.max_parallel < 1:
+        parser.error("--max-parallel must be at least 1")
+
+    epic = args.epic
+    plan_files = {}
+    if args.plan:
+        epic, plan_files = parse_plan(Path(args.plan))
+        if not epic:
+            sys.exit(f"error: no 'Epic: `<id>`' found in {args.plan}")
+
+    only = None
+    if args.issues is not None:
+        only = {issue_id.strip() for issue_id in args.issues.split(",") if issue_id.strip()}
+        if not only:
+            sys.exit("error: --issues needs at least one issue ID")
+
+    open_issues = run_bd(args.bd, ["list", "--status", "open"])
+    ready_issues = run_bd(args.bd, ["ready"])
+    blocked_issues = run_bd(args.bd, ["blocked"])
+    deferred_issues = run_bd(args.bd, ["list", "--status", "deferred"])
+
+    nodes, deps, external = build_graph(open_issues, ready_issues, blocked_issues, deferred_issues, epic, only)
+    waves, cyclic = topological_waves(deps)
+    for issue_id in cyclic:
+        del deps[issue_id]
+
+    tails = tail_lengths(deps, waves)
+
+    # Plan sections take precedence, issue text fills in the rest
+    files = {}
+    for issue_id in deps:
+        files[issue_id] = plan_files.get(issue_id) or issue_files(nodes[issue_id])
+
+    batches = schedule_batches(deps, tails, nodes, files, args.max_parallel)
+
+    output = {
+        "epic": epic,
+        "max_parallel": args.max_parallel,
+        "batches": batches,
+        "waves": waves,
+        "critical_path": critical_path(deps, tails),
+        "conflicts": find_conflicts(files),
+        "blocked": [
+            {"id": issue_id, "blocked_by": blockers}
+            for issue_id, blockers in sorted(external.items())
+        ],
+        "cycles": cyclic,
+        "issues": {
+            issue_id: {
+                "title": nodes[issue_id].get("title", ""),
+                "priority": nodes[issue_id].get("priority"),
+                "depends_on": sorted(deps[issue_id]),
+                "files": sorted(files[issue_id]),
+            }
+            for issue_id in sorted(deps)
+        },
+    }
+
+    print(json.dumps(output, indent=2))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Load test for the skill hooks and their shared cache.
+
+Replays recorded hook stdin payloads from many concurrent processes, the way
+dozens of sessions on one machine would, once with the cache disabled and
+once against a cold cache. Reports throughput and latency for both, and
+checks that:
+1. Every hook run exits cleanly
+2. Every cached output matches an uncached run of the same payload
+3. A cold cache is rebuilt once, not once per process
+
+Payloads are a JSONL file of hook stdin objects. Each needs a
+`hook_event_name` (SessionStart, UserPromptSubmit, Stop), which Claude Code
+includes in every hook input. Hooks run from the plugin root, so relative
+`cwd` and `transcript_path` values resolve against it. A sample lives in
+fixtures/hooks/payloads.jsonl.
+
+Usage:
+    hooks-load-test.py [payloads.jsonl] [--processes N] [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Tuple
+
+
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+SAMPLE_PAYLOADS = Path(__file__).resolve().parent / "fixtures" / "hooks" / "payloads.jsonl"
+
+HOOK_SCRIPTS = {
+    "SessionStart": PLUGIN_ROOT / "hooks" / "load-skills-context.py",
+    "UserPromptSubmit": PLUGIN_ROOT / "hooks" / "skill-activator.py",
+    "Stop": PLUGIN_ROOT / "hooks" / "heal-skills-trigger.py",
+}
+
+
+def load_payloads(payloads_path: Path) -> List[Dict]:
+    """Load recorded hook payloads, skipping events without a hook script."""
+    payloads = []
+    with open(payloads_path, "r") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                sys.exit(f"error: {payloads_path}:{line_number}: invalid JSON")
+            if payload.get("hook_event_name") in HOOK_SCRIPTS:
+                payloads.append(payload)
+    return payloads
+
+
+def run_hook(payload: Dict, env: Dict[str, str]) -> Tuple[int, str, float]:
+    """Run the hook for a payload. Returns (exit code, stdout, seconds)."""
+    script = HOOK_SCRIPTS[payload["hook_event_name"]]
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        cwd=PLUGIN_ROOT,
+        env=env,
+    )
+    return result.returncode, result.stdout, time.perf_counter() - start
+
+
+def run_jobs(payloads: List[Dict], jobs: List[int], env: Dict[str, str], processes: int) -> Tuple[list, float]:
+    """Run every job concurrently. Returns (results, elapsed seconds)."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(lambda i: run_hook(payloads[i], env), jobs))
+    return results, time.perf_counter() - start
+
+
+def summarize(label: str, results: list, elapsed: float) -> str:
+    """Format throughput and p50/p95 latency for one replay."""
+    latencies = sorted(seconds for _, _, seconds in results)
+    p50 = statistics.median(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return f"{label:<13}{len(results) / elapsed:.1f} runs/s, p50 {p50 * 1000:.1f}ms, p95 {p95 * 1000:.1f}ms"
+
+
+def read_generations(cache_dir: Path) -> Dict[str, int]:
+    """Read the generation counter of every cache file."""
+    generations = {}
+    for cache_file in sorted(cache_dir.glob("manifest-*.json")):
+        try:
+            generations[cache_file.name] = json.loads(cache_file.read_text()).get("generation", 0)
+        except (OSError, json.JSONDecodeError):
+            generations[cache_file.name] = -1
+    return generations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay hook payloads concurrently against the shared skills cache")
+    parser.add_argument("payloads", nargs="?", default=str(SAMPLE_PAYLOADS),
+                        help="JSONL file of recorded hook stdin payloads (default: bundled sample)")
+    parser.add_argument("--processes", type=int, default=32, help="Concurrent hook processes (default: 32)")
+    parser.add_argument("--repeat", type=int, default=10, help="Times to replay each payload (default: 10)")
+    args = parser.parse_args()
+
+    if args.processes < 1:
+        parser.error("--processes must be at least 1")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    payloads = load_payloads(Path(args.payloads))
+    if not payloads:
+        sys.exit("error: no payloads with a known hook_event_name")
+
+    # Fixed hash seed so set-ordered output (matched keywords) is comparable
+    base_env = dict(os.environ, CLAUDE_PLUGIN_ROOT=str(PLUGIN_ROOT), PYTHONHASHSEED="0")
+
+    # Expected outputs come from uncached runs
+    uncached_env = dict(base_env, AA_SKILLS_CACHE="0")
+    expected = []
+    for payload in payloads:
+        code, stdout, _ = run_hook(payload, uncached_env)
+        expected.append((code, stdout))
+
+    jobs = [i for _ in range(args.repeat) for i in range(len(payloads))]
+
+    # Same concurrent job list without the cache, as the baseline
+    uncached_results, uncached_elapsed = run_jobs(payloads, jobs, uncached_env, args.processes)
+
+    with tempfile.TemporaryDirectory(prefix="aa-skills-cache-") as cache_dir:
+        cached_env = dict(base_env, AA_SKILLS_CACHE_DIR=cache_dir)
+        results, elapsed = run_jobs(payloads, jobs, cached_env, args.processes)
+        generations = read_generations(Path(cache_dir))
+
+    failures = 0
+    mismatches = 0
+    for i, (code, stdout, _) in zip(jobs, results):
+        if code != 0:
+            failures += 1
+        elif (code, stdout) != expected[i]:
+            mismatches += 1
+    failures += sum(1 for code, _, _ in uncached_results if code != 0)
+
+    print(f"Runs:        {len(results)} per mode ({len(payloads)} payloads x {args.repeat}, {args.processes} concurrent)")
+    print(summarize("Uncached:", uncached_results, uncached_elapsed))
+    print(summarize("Cached:", results, elapsed))
+    print(f"Failures:    {failures}")
+    print(f"Mismatches:  {mismatches}")
+    for name, generation in generations.items():
+        print(f"Cache:       {name} generation {generation}")
+
+    # Nothing changes on disk during the run, so each cache should be built once
+    rebuilt = [name for name, generation in generations.items() if generation != 1]
+    if rebuilt:
+        print(f"Rebuilt more than once: {', '.join(rebuilt)}")
+
+    sys.exit(1 if failures or mismatches or rebuilt else 0)
+
+
+if __name__ == "__main__":
+    main()